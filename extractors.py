@@ -1,11 +1,125 @@
+import os
+import multiprocessing
 import pdfplumber
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
 from docx import Document as DocxDocument
-from typing import Optional
+from typing import Iterator, List, Optional, Tuple
+
+# PDFs with fewer pages than this are extracted serially; starting the
+# (spawned) page processes costs more than it saves on short documents.
+PARALLEL_PDF_MIN_PAGES = 16
+
+
+def create_page_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Process pool for PDF page extraction.
+    
+    Spawn rather than fork: the caller may be running other threads whose
+    locks a forked child would inherit in a held state. Spawned children
+    re-import the parent's __main__ module, so long-running callers should
+    create one pool and pass it to every extraction call.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _extract_page_range(args: Tuple[str, int, int]) -> List[str]:
+    """Extract text from pages [start, stop) of a PDF. Runs in a worker process."""
+    file_path, start, stop = args
+    with pdfplumber.open(file_path) as pdf:
+        return [pdf.pages[i].extract_text() or "" for i in range(start, stop)]
 
 
 class TextExtractor:
     """Base class for text extraction from various document formats."""
     
+    @staticmethod
+    def iter_paragraphs_docx(file_path: str) -> Iterator[str]:
+        """
+        Yield paragraph texts of a DOCX file one at a time.
+        
+        Args:
+            file_path: Path to the DOCX file
+            
+        Yields:
+            Text of each paragraph, in document order
+        """
+        doc = DocxDocument(file_path)
+        for para in doc.paragraphs:
+            yield para.text
+    
+    @staticmethod
+    def iter_pages_pdf(
+        file_path: str,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None
+    ) -> Iterator[str]:
+        """
+        Yield page texts of a PDF file one at a time using pdfplumber.
+        
+        Args:
+            file_path: Path to the PDF file
+            max_workers: Upper bound on page extraction processes; defaults to
+                the CPU count, 1 or less extracts serially
+            executor: Long-lived page pool (see create_page_pool) with at least
+                max_workers processes; if None a pool is started for this file
+            
+        Yields:
+            Text of each page, in page order; pages without text are skipped
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        with pdfplumber.open(file_path) as pdf:
+            page_count = len(pdf.pages)
+            workers = min(page_count, max_workers)
+            if page_count < PARALLEL_PDF_MIN_PAGES or workers < 2:
+                for page in pdf.pages:
+                    text = page.extract_text()
+                    if text:
+                        yield text
+                return
+        
+        # Layout analysis is CPU-bound, so pages are split into one contiguous
+        # range per worker process; each worker opens the file only once.
+        bounds = [page_count * i // workers for i in range(workers + 1)]
+        ranges = [(file_path, start, stop) for start, stop in zip(bounds, bounds[1:])]
+        pool = nullcontext(executor) if executor else create_page_pool(workers)
+        with pool as page_executor:
+            for range_texts in page_executor.map(_extract_page_range, ranges):
+                yield from (text for text in range_texts if text)
+    
+    @staticmethod
+    def iter_text(
+        file_path: str,
+        pdf_workers: Optional[int] = None,
+        pdf_executor: Optional[Executor] = None
+    ) -> Iterator[str]:
+        """
+        Auto-detect file type and yield text chunks (paragraphs or pages).
+        
+        Args:
+            file_path: Path to the document file
+            pdf_workers: Upper bound on PDF page extraction processes
+            pdf_executor: Long-lived pool for PDF page extraction
+            
+        Returns:
+            Iterator over text chunks in document order
+            
+        Raises:
+            ValueError: If file format is not supported
+        """
+        file_path_lower = file_path.lower()
+        
+        if file_path_lower.endswith('.docx'):
+            return TextExtractor.iter_paragraphs_docx(file_path)
+        elif file_path_lower.endswith('.pdf'):
+            return TextExtractor.iter_pages_pdf(file_path, pdf_workers, pdf_executor)
+        else:
+            raise ValueError(f"Unsupported file format: {file_path}")
+    
     @staticmethod
     def extract_from_docx(file_path: str) -> str:
         """
@@ -17,11 +131,7 @@ class TextExtractor:
         Returns:
             Full text content as string
         """
-        doc = DocxDocument(file_path)
-        full_text = []
-        for para in doc.paragraphs:
-            full_text.append(para.text)
-        return '\n'.join(full_text)
+        return '\n'.join(TextExtractor.iter_paragraphs_docx(file_path))
     
     @staticmethod
     def extract_from_pdf(file_path: str) -> str:
@@ -34,13 +144,7 @@ class TextExtractor:
         Returns:
             Full text content as string
         """
-        full_text = []
-        with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                if text:
-                    full_text.append(text)
-        return '\n'.join(full_text)
+        return '\n'.join(TextExtractor.iter_pages_pdf(file_path))
     
     @staticmethod
     def extract_text(file_path: str) -> str:
@@ -56,11 +160,4 @@ class TextExtractor:
         Raises:
             ValueError: If file format is not supported
         """
-        file_path_lower = file_path.lower()
-        
-        if file_path_lower.endswith('.docx'):
-            return TextExtractor.extract_from_docx(file_path)
-        elif file_path_lower.endswith('.pdf'):
-            return TextExtractor.extract_from_pdf(file_path)
-        else:
-            raise ValueError(f"Unsupported file format: {file_path}")
+        return '\n'.join(TextExtractor.iter_text(file_path))
@@ -1,21 +1,30 @@
 import os
 import uuid
+import hashlib
 import shutil
-import zipfile
+import tarfile
 import asyncio
 import logging
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, File, UploadFile, BackgroundTasks, HTTPException, Form
+from fastapi import (
+    FastAPI, File, UploadFile, BackgroundTasks, HTTPException, Form, Header,
+    Response, WebSocket, WebSocketDisconnect
+)
 from fastapi.responses import FileResponse, HTMLResponse
 from fastapi.staticfiles import StaticFiles
 import spacy
 
 from models import UploadResponse, JobStatusResponse, JobStatus
-from processor import DocumentProcessor
+from worker import SPACY_MODEL, init_worker, process_documents_job, worker_ready
 
 # Configure logging
 logging.basicConfig(
@@ -25,35 +34,69 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Global state
-jobs: Dict[str, Dict] = {}
-nlp_model: Optional[spacy.language.Language] = None
-processor: Optional[DocumentProcessor] = None
+# Insertion-ordered, so the oldest jobs are always at the front
+jobs: "OrderedDict[str, Dict]" = OrderedDict()
+jobs_lock = asyncio.Lock()
+process_pool: Optional[ProcessPoolExecutor] = None
+# True once a worker of the current pool has loaded the SpaCy model
+model_loaded = False
+pool_warmup_task: Optional[asyncio.Task] = None
+# Live progress published by worker processes, keyed by job_id
+job_progress = None
+# Plain-dict copy of job_progress; reading the Manager proxy is a blocking
+# IPC round trip, so it is copied off the event loop once per tick
+progress_snapshot: Dict[str, Dict] = {}
 
 # Configuration
 TEMP_DIR = Path("/tmp/jobs")
 TEMP_DIR.mkdir(exist_ok=True)
 CLEANUP_TIMEOUT = timedelta(hours=1)
+CLEANUP_INTERVAL = timedelta(minutes=5)
+MAX_JOBS = 1024
+WORKER_PROCESSES = max(1, (os.cpu_count() or 2) // 2)
+# Each job worker may extract PDF pages with its own share of the CPUs the
+# job workers leave free (1 means serial extraction)
+PDF_PAGE_WORKERS = 1 + max(0, (os.cpu_count() or 2) - WORKER_PROCESSES) // WORKER_PROCESSES
+UPLOAD_CHUNK_SIZE = 1 << 20
+ALLOWED_EXTENSIONS = {'.docx', '.pdf'}
+# How often a status WebSocket checks its job for changes, in seconds
+WS_STATUS_INTERVAL = 0.25
+# How often worker progress is copied into progress_snapshot, in seconds
+PROGRESS_SYNC_INTERVAL = 0.25
+# Seconds a client may reuse its own /health response; private, so shared
+# caches such as a reverse proxy never answer liveness probes
+HEALTH_MAX_AGE = 60
+# Idle keep-alive connections are held longer than uvicorn's 5 s default so
+# backed-off status pollers can reuse them
+KEEP_ALIVE_TIMEOUT = 30
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Load SpaCy model on startup, cleanup on shutdown."""
-    global nlp_model, processor
+    """Start the worker process pool on startup, cleanup on shutdown."""
+    global job_progress
     
-    logger.info("Starting up: Loading SpaCy model...")
-    try:
-        nlp_model = spacy.load('ru_core_news_sm')
-        processor = DocumentProcessor(nlp_model)
-        logger.info("SpaCy model loaded successfully.")
-    except OSError:
+    logger.info("Starting up: Checking SpaCy model...")
+    if not spacy.util.is_package(SPACY_MODEL):
         logger.error("SpaCy model not found. Downloading...")
-        os.system("python -m spacy download ru_core_news_sm")
-        nlp_model = spacy.load('ru_core_news_sm')
-        processor = DocumentProcessor(nlp_model)
-        logger.info("SpaCy model downloaded and loaded.")
+        os.system(f"python -m spacy download {SPACY_MODEL}")
+    
+    manager = multiprocessing.Manager()
+    job_progress = manager.dict()
+    start_process_pool()
+    # Serve only once a worker has loaded the model (or failed to)
+    await pool_warmup_task
+    
+    cleanup_task = asyncio.create_task(cleanup_loop())
+    progress_task = asyncio.create_task(progress_sync_loop())
     
     yield
     
+    cleanup_task.cancel()
+    progress_task.cancel()
+    pool_warmup_task.cancel()
+    process_pool.shutdown(wait=False, cancel_futures=True)
+    manager.shutdown()
     logger.info("Shutting down: Cleaning up temporary files...")
     if TEMP_DIR.exists():
         shutil.rmtree(TEMP_DIR, ignore_errors=True)
@@ -70,105 +113,248 @@ app = FastAPI(
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
+def start_process_pool():
+    """
+    Replace the worker pool with a new one and start warming it up.
+    
+    Jobs are CPU-bound, so they run in worker processes that each load the
+    SpaCy model once; spawn avoids forking the running event loop.
+    """
+    global process_pool, model_loaded, pool_warmup_task
+    process_pool = ProcessPoolExecutor(
+        max_workers=WORKER_PROCESSES,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker,
+        initargs=(PDF_PAGE_WORKERS,)
+    )
+    model_loaded = False
+    pool_warmup_task = asyncio.create_task(warm_up_pool(process_pool))
+    logger.info(f"Started process pool with {WORKER_PROCESSES} worker(s).")
+
+
+async def warm_up_pool(pool: ProcessPoolExecutor):
+    """
+    Wait until a worker of the pool has loaded the SpaCy model.
+    
+    A worker whose initializer fails (e.g. the model is missing) breaks the
+    pool, so this is what tells whether jobs can actually run.
+    """
+    global model_loaded
+    loop = asyncio.get_running_loop()
+    try:
+        ready = await loop.run_in_executor(pool, worker_ready)
+    except BrokenProcessPool as e:
+        logger.error(f"Worker pool failed to load the SpaCy model: {e}")
+        ready = False
+    if pool is process_pool:
+        model_loaded = ready
+        if ready:
+            logger.info("Worker pool ready: SpaCy model loaded.")
+
+
+def restart_broken_pool(pool: ProcessPoolExecutor):
+    """Replace a broken worker pool, unless it has been replaced already."""
+    if pool is not process_pool:
+        return
+    logger.error("Worker pool is broken, restarting it")
+    pool.shutdown(wait=False, cancel_futures=True)
+    start_process_pool()
+
+
+def remove_job(job_id: str):
+    """Drop a job from the job table and delete its directory."""
+    jobs.pop(job_id, None)
+    job_dir = TEMP_DIR / job_id
+    if job_dir.exists():
+        shutil.rmtree(job_dir, ignore_errors=True)
+
+
 def cleanup_old_jobs():
-    """Remove old job directories."""
+    """Remove expired jobs from the front of the job table."""
     cutoff_time = datetime.now() - CLEANUP_TIMEOUT
-    for job_id, job_data in list(jobs.items()):
-        job_time = job_data.get('created_at', datetime.now())
-        if job_time < cutoff_time:
-            logger.info(f"Cleaning up old job: {job_id}")
-            job_dir = TEMP_DIR / job_id
-            if job_dir.exists():
-                shutil.rmtree(job_dir, ignore_errors=True)
-            del jobs[job_id]
+    while jobs:
+        job_id, job_data = next(iter(jobs.items()))
+        if job_data['created_at'] >= cutoff_time:
+            break
+        logger.info(f"Cleaning up old job: {job_id}")
+        remove_job(job_id)
+
 
+async def cleanup_loop():
+    """Periodically evict expired jobs."""
+    while True:
+        await asyncio.sleep(CLEANUP_INTERVAL.total_seconds())
+        async with jobs_lock:
+            cleanup_old_jobs()
 
-def create_zip_archive(source_dir: Path, output_zip: Path) -> Path:
-    """Create a zip archive from directory contents."""
-    with zipfile.ZipFile(output_zip, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(source_dir):
-            for file in files:
-                file_path = Path(root) / file
-                arcname = file_path.relative_to(source_dir)
-                zipf.write(file_path, arcname)
-    return output_zip
 
+async def progress_sync_loop():
+    """Periodically copy worker progress out of the Manager dict."""
+    global progress_snapshot
+    while True:
+        progress_snapshot = await asyncio.to_thread(job_progress.copy)
+        await asyncio.sleep(PROGRESS_SYNC_INTERVAL)
 
-async def process_documents_job(
+
+def on_job_done(
     job_id: str,
-    file_paths: List[Path],
-    merge_mode: bool
+    job: Dict,
+    pool: ProcessPoolExecutor,
+    future: asyncio.Future
 ):
-    """Background task to process documents."""
+    """Copy the final state of a worker job into its job record."""
+    # Drop the job's progress entry without blocking the event loop on IPC
+    asyncio.get_running_loop().run_in_executor(None, job_progress.pop, job_id, None)
+    if future.cancelled():
+        return
     try:
-        jobs[job_id]['status'] = JobStatus.PROCESSING
-        jobs[job_id]['message'] = "Processing documents..."
-        
-        job_dir = TEMP_DIR / job_id
-        output_base_dir = job_dir / "output"
-        output_base_dir.mkdir(exist_ok=True)
-        
-        total_articles = 0
-        
-        if merge_mode:
-            # Process all files into a single output directory
-            merged_output_dir = output_base_dir / "merged_articles"
-            merged_output_dir.mkdir(exist_ok=True)
-            
-            for idx, file_path in enumerate(file_paths):
-                jobs[job_id]['message'] = f"Processing file {idx+1}/{len(file_paths)}: {file_path.name}"
-                jobs[job_id]['progress'] = int((idx / len(file_paths)) * 90)
-                
-                result = processor.process_document(
-                    str(file_path),
-                    str(merged_output_dir)
+        job.update(future.result())
+    except Exception as e:
+        # The worker process died or the pool is broken
+        logger.error(f"Job {job_id} failed: {str(e)}")
+        if isinstance(e, BrokenProcessPool):
+            restart_broken_pool(pool)
+        job.update(
+            status=JobStatus.FAILED,
+            message="Processing failed",
+            error=str(e),
+            progress=0
+        )
+
+
+def build_job_status(job_id: str) -> JobStatusResponse:
+    """Current status of a known job."""
+    job_data = jobs[job_id]
+    if job_data['status'] not in (JobStatus.COMPLETED, JobStatus.FAILED):
+        # Running jobs report progress through the shared dict; finished
+        # jobs ignore it, since the snapshot may still hold their last update
+        job_data = {**job_data, **progress_snapshot.get(job_id, {})}
+    
+    return JobStatusResponse(
+        job_id=job_id,
+        status=job_data['status'],
+        progress=job_data['progress'],
+        message=job_data['message'],
+        total_articles=job_data.get('total_articles'),
+        error=job_data.get('error')
+    )
+
+
+def unpack_documents(fileobj, target_dir: Path) -> List[Path]:
+    """
+    Extract the documents of a plain (uncompressed) tar archive into target_dir.
+    
+    Only regular files are extracted, under their base name, so member paths
+    cannot escape target_dir. Compressed archives are refused: extracted size
+    then stays bounded by the upload size, as with /upload.
+    
+    Raises:
+        ValueError: If the archive contains a file that is not DOCX or PDF,
+            or two files with the same base name
+    """
+    file_paths = []
+    seen_names = set()
+    with tarfile.open(fileobj=fileobj, mode='r:') as tar:
+        for member in tar:
+            if not member.isfile():
+                continue
+            name = Path(member.name).name
+            if Path(name).suffix.lower() not in ALLOWED_EXTENSIONS:
+                raise ValueError(
+                    f"Unsupported file type: {name}. Only DOCX and PDF are allowed."
                 )
-                total_articles += result['articles_count']
-                logger.info(f"Processed {file_path.name}: {result['articles_count']} articles")
-        else:
-            # Process each file into separate directories
-            for idx, file_path in enumerate(file_paths):
-                jobs[job_id]['message'] = f"Processing file {idx+1}/{len(file_paths)}: {file_path.name}"
-                jobs[job_id]['progress'] = int((idx / len(file_paths)) * 90)
-                
-                doc_name = file_path.stem
-                file_output_dir = output_base_dir / doc_name
-                file_output_dir.mkdir(exist_ok=True)
-                
-                result = processor.process_document(
-                    str(file_path),
-                    str(file_output_dir)
+            if name in seen_names:
+                raise ValueError(f"Duplicate file name in archive: {name}")
+            seen_names.add(name)
+            file_path = target_dir / name
+            with tar.extractfile(member) as src, open(file_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, UPLOAD_CHUNK_SIZE)
+            file_paths.append(file_path)
+    return file_paths
+
+
+def evict_finished_job() -> bool:
+    """
+    Remove the oldest completed or failed job.
+    
+    Jobs still queued or running are never evicted, since a worker may be
+    writing into their directory.
+    
+    Returns:
+        False if every job is still in progress
+    """
+    for job_id, job_data in jobs.items():
+        if job_data['status'] in (JobStatus.COMPLETED, JobStatus.FAILED):
+            logger.info(f"Evicting job {job_id}: job table is full")
+            remove_job(job_id)
+            return True
+    return False
+
+
+async def start_job(job_id: str, job_dir: Path, file_paths: List[Path], merge_mode: bool):
+    """
+    Register a job and submit it to the process pool.
+    
+    Raises:
+        HTTPException: 503 if the workers cannot process documents or the
+            job table is full of unfinished jobs
+    """
+    if not model_loaded:
+        shutil.rmtree(job_dir, ignore_errors=True)
+        raise HTTPException(
+            status_code=503,
+            detail="Document processing is unavailable: SpaCy model not loaded"
+        )
+    
+    async with jobs_lock:
+        # Bound memory: make room by evicting finished jobs, oldest first
+        while len(jobs) >= MAX_JOBS:
+            if not evict_finished_job():
+                shutil.rmtree(job_dir, ignore_errors=True)
+                raise HTTPException(
+                    status_code=503,
+                    detail="Too many jobs in progress, try again later"
                 )
-                total_articles += result['articles_count']
-                logger.info(f"Processed {file_path.name}: {result['articles_count']} articles")
-        
-        # Create zip archive
-        jobs[job_id]['message'] = "Creating archive..."
-        jobs[job_id]['progress'] = 95
-        
-        zip_path = job_dir / f"{job_id}.zip"
-        create_zip_archive(output_base_dir, zip_path)
-        
-        # Update job status
-        jobs[job_id]['status'] = JobStatus.COMPLETED
-        jobs[job_id]['message'] = "Processing completed successfully"
-        jobs[job_id]['progress'] = 100
-        jobs[job_id]['total_articles'] = total_articles
-        jobs[job_id]['zip_path'] = zip_path
-        
-        logger.info(f"Job {job_id} completed. Total articles: {total_articles}")
-        
-    except Exception as e:
-        logger.error(f"Job {job_id} failed: {str(e)}", exc_info=True)
-        jobs[job_id]['status'] = JobStatus.FAILED
-        jobs[job_id]['message'] = "Processing failed"
-        jobs[job_id]['error'] = str(e)
-        jobs[job_id]['progress'] = 0
+        jobs[job_id] = {
+            'status': JobStatus.PENDING,
+            'progress': 0,
+            'message': 'Job queued for processing',
+            'created_at': datetime.now(),
+            'files_count': len(file_paths),
+            'merge_mode': merge_mode,
+            'total_articles': None,
+            'error': None,
+            'zip_path': None
+        }
+    
+    # Run the job in the process pool so the event loop stays responsive
+    loop = asyncio.get_running_loop()
+    pool = process_pool
+    try:
+        future = loop.run_in_executor(
+            pool,
+            process_documents_job,
+            job_id,
+            job_dir,
+            file_paths,
+            merge_mode,
+            job_progress
+        )
+    except BrokenProcessPool:
+        restart_broken_pool(pool)
+        async with jobs_lock:
+            remove_job(job_id)
+        raise HTTPException(
+            status_code=503,
+            detail="Worker pool is restarting, try again later"
+        )
+    future.add_done_callback(partial(on_job_done, job_id, jobs[job_id], pool))
+    
+    logger.info(f"Created job {job_id} with {len(file_paths)} files (merge_mode={merge_mode})")
 
 
 @app.post("/upload", response_model=UploadResponse)
 async def upload_documents(
-    background_tasks: BackgroundTasks,
     files: List[UploadFile] = File(...),
     merge_mode: bool = Form(False)
 ):
@@ -182,16 +368,13 @@ async def upload_documents(
     Returns:
         Job ID for tracking processing status
     """
-    cleanup_old_jobs()
-    
     if not files:
         raise HTTPException(status_code=400, detail="No files provided")
     
     # Validate file types
-    allowed_extensions = {'.docx', '.pdf'}
     for file in files:
         ext = Path(file.filename).suffix.lower()
-        if ext not in allowed_extensions:
+        if ext not in ALLOWED_EXTENSIONS:
             raise HTTPException(
                 status_code=400,
                 detail=f"Unsupported file type: {file.filename}. Only DOCX and PDF are allowed."
@@ -210,48 +393,77 @@ async def upload_documents(
     for file in files:
         file_path = uploads_dir / file.filename
         with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
+            # Copy in fixed-size chunks off the event loop instead of reading
+            # the whole upload into memory first
+            await asyncio.to_thread(shutil.copyfileobj, file.file, f, UPLOAD_CHUNK_SIZE)
         file_paths.append(file_path)
         logger.info(f"Saved uploaded file: {file.filename}")
     
-    # Initialize job state
-    jobs[job_id] = {
-        'status': JobStatus.PENDING,
-        'progress': 0,
-        'message': 'Job queued for processing',
-        'created_at': datetime.now(),
-        'files_count': len(files),
-        'merge_mode': merge_mode,
-        'total_articles': None,
-        'error': None,
-        'zip_path': None
-    }
+    await start_job(job_id, job_dir, file_paths, merge_mode)
     
-    # Start background processing
-    background_tasks.add_task(
-        process_documents_job,
-        job_id,
-        file_paths,
-        merge_mode
+    return UploadResponse(
+        job_id=job_id,
+        message="Files uploaded successfully. Processing started.",
+        files_received=len(files)
     )
+
+
+@app.post("/upload_pack", response_model=UploadResponse)
+async def upload_pack(
+    archive: UploadFile = File(...),
+    merge_mode: bool = Form(False)
+):
+    """
+    Upload documents packed into a single tar archive.
+    
+    Large batches arrive as one multipart part instead of one per document.
+    Only plain, uncompressed tar archives are accepted.
     
-    logger.info(f"Created job {job_id} with {len(files)} files (merge_mode={merge_mode})")
+    Args:
+        archive: Tar archive of DOCX or PDF files
+        merge_mode: If True, merge all files into single output; if False, separate outputs
+        
+    Returns:
+        Job ID for tracking processing status
+    """
+    job_id = str(uuid.uuid4())
+    job_dir = TEMP_DIR / job_id
+    uploads_dir = job_dir / "uploads"
+    uploads_dir.mkdir(parents=True, exist_ok=True)
+    
+    try:
+        file_paths = await asyncio.to_thread(unpack_documents, archive.file, uploads_dir)
+        if not file_paths:
+            raise ValueError("No files found in archive")
+    except Exception as e:
+        # Never leave a partly extracted upload behind
+        shutil.rmtree(job_dir, ignore_errors=True)
+        if isinstance(e, (tarfile.TarError, ValueError, EOFError, OSError)):
+            # Truncated or malformed archive
+            raise HTTPException(status_code=400, detail=f"Invalid archive: {e}")
+        raise
+    
+    logger.info(f"Unpacked {len(file_paths)} file(s) from {archive.filename}")
+    await start_job(job_id, job_dir, file_paths, merge_mode)
     
     return UploadResponse(
         job_id=job_id,
-        message="Files uploaded successfully. Processing started.",
-        files_received=len(files)
+        message="Archive uploaded successfully. Processing started.",
+        files_received=len(file_paths)
     )
 
 
 @app.get("/status/{job_id}", response_model=JobStatusResponse)
-async def get_job_status(job_id: str):
+async def get_job_status(job_id: str, if_none_match: Optional[str] = Header(None)):
     """
     Get the status of a processing job.
     
+    The response carries an ETag of the status body; pollers that send it
+    back in If-None-Match get an empty 304 while nothing has changed.
+    
     Args:
         job_id: Job identifier
+        if_none_match: ETag of the status the client already has
         
     Returns:
         Current job status and progress
@@ -259,16 +471,47 @@ async def get_job_status(job_id: str):
     if job_id not in jobs:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    job_data = jobs[job_id]
+    body = build_job_status(job_id).model_dump_json().encode()
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
     
-    return JobStatusResponse(
-        job_id=job_id,
-        status=job_data['status'],
-        progress=job_data['progress'],
-        message=job_data['message'],
-        total_articles=job_data.get('total_articles'),
-        error=job_data.get('error')
-    )
+    if if_none_match == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type='application/json', headers=headers)
+
+
+@app.websocket("/ws/status/{job_id}")
+async def job_status_updates(websocket: WebSocket, job_id: str):
+    """
+    Push job status updates over a WebSocket.
+    
+    A JSON frame shaped like the /status response is sent whenever the job
+    status changes. The server closes the socket once the job has completed
+    or failed.
+    
+    Args:
+        websocket: Client connection
+        job_id: Job identifier
+    """
+    if job_id not in jobs:
+        # Rejected before accepting, so the client sees a failed handshake
+        await websocket.close(code=1008)
+        return
+    
+    await websocket.accept()
+    last_sent = None
+    try:
+        while job_id in jobs:
+            status = build_job_status(job_id)
+            if status != last_sent:
+                await websocket.send_json(status.model_dump(mode='json'))
+                last_sent = status
+            if status.status in (JobStatus.COMPLETED, JobStatus.FAILED):
+                break
+            await asyncio.sleep(WS_STATUS_INTERVAL)
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
 
 
 @app.get("/download/{job_id}")
@@ -294,33 +537,49 @@ async def download_result(job_id: str, background_tasks: BackgroundTasks):
         )
     
     zip_path = job_data.get('zip_path')
-    if not zip_path or not Path(zip_path).exists():
+    try:
+        zip_stat = os.stat(zip_path) if zip_path else None
+    except FileNotFoundError:
+        zip_stat = None
+    if zip_stat is None:
         raise HTTPException(status_code=404, detail="Result file not found")
     
     # Schedule cleanup after download
-    def cleanup_job():
+    async def cleanup_job():
         logger.info(f"Cleaning up job {job_id} after download")
-        job_dir = TEMP_DIR / job_id
-        if job_dir.exists():
-            shutil.rmtree(job_dir, ignore_errors=True)
-        if job_id in jobs:
-            del jobs[job_id]
+        async with jobs_lock:
+            remove_job(job_id)
     
     background_tasks.add_task(cleanup_job)
     
+    # Passing the stat result spares FileResponse a second stat (it also
+    # sets Content-Length from it)
     return FileResponse(
         path=zip_path,
         media_type='application/zip',
-        filename=f'processed_articles_{job_id}.zip'
+        filename=f'processed_articles_{job_id}.zip',
+        stat_result=zip_stat,
+        headers={
+            # A GET deletes the job, so the URL cannot be fetched again
+            'Cache-Control': 'no-store'
+        }
     )
 
 
 @app.get("/health")
-async def health_check():
-    """Health check endpoint."""
+async def health_check(response: Response):
+    """
+    Health check endpoint.
+    
+    Reports 503 while no worker has the SpaCy model loaded (pool failed to
+    start or is restarting).
+    """
+    response.headers['Cache-Control'] = f'private, max-age={HEALTH_MAX_AGE}'
+    if not model_loaded:
+        response.status_code = 503
     return {
-        "status": "healthy",
-        "spacy_model_loaded": nlp_model is not None,
+        "status": "healthy" if model_loaded else "unhealthy",
+        "spacy_model_loaded": model_loaded,
         "active_jobs": len(jobs)
     }
 
@@ -340,7 +599,9 @@ async def api_info():
         "version": "1.0.0",
         "endpoints": {
             "upload": "POST /upload - Upload documents for processing",
+            "upload_pack": "POST /upload_pack - Upload documents as one tar archive",
             "status": "GET /status/{job_id} - Check job status",
+            "status_updates": "WS /ws/status/{job_id} - Job status pushed on change",
             "download": "GET /download/{job_id} - Download results",
             "health": "GET /health - Health check"
         }
@@ -349,4 +610,11 @@ async def api_info():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        http="httptools",
+        loop="uvloop",
+        timeout_keep_alive=KEEP_ALIVE_TIMEOUT
+    )
@@ -1,6 +1,7 @@
 from pydantic import BaseModel
 from typing import List, Optional
 from enum import Enum
+from dataclasses import dataclass, field
 
 
 class JobStatus(str, Enum):
@@ -32,3 +33,38 @@ class ArticleMetadata(BaseModel):
     paragraph_title: Optional[str] = None
     keywords: List[str] = []
     topic: str = ""
+
+
+@dataclass
+class ArticleBatch:
+    """
+    Articles of a document stored column-wise (one list per field).
+    
+    Row i across all columns describes article i. The keywords and topics
+    columns stay empty until the articles have been enriched.
+    """
+    titles: List[str] = field(default_factory=list)
+    contents: List[str] = field(default_factory=list)
+    sections: List[Optional[str]] = field(default_factory=list)
+    chapters: List[Optional[str]] = field(default_factory=list)
+    paragraphs: List[Optional[str]] = field(default_factory=list)
+    keywords: List[List[str]] = field(default_factory=list)
+    topics: List[str] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.titles)
+    
+    def append(
+        self,
+        title: str,
+        content: str,
+        section: Optional[str] = None,
+        chapter: Optional[str] = None,
+        paragraph: Optional[str] = None
+    ):
+        """Add an article row (without keywords and topic)."""
+        self.titles.append(title)
+        self.contents.append(content)
+        self.sections.append(section)
+        self.chapters.append(chapter)
+        self.paragraphs.append(paragraph)
@@ -1,25 +1,58 @@
 import os
 import re
+import queue
+import threading
+import numpy as np
 import spacy
-from collections import Counter
-from typing import List, Dict, Tuple, Optional
-from langchain.schema import Document
-from extractors import TextExtractor
+from spacy.attrs import LEMMA, IS_STOP, IS_PUNCT, LIKE_NUM, IS_SPACE
+from spacy.pipeline import Sentencizer
+from spacy.tokens import Doc, Span
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from typing import Callable, List, Dict, FrozenSet, Iterable, Tuple, Optional, Union
+from extractors import TextExtractor, create_page_pool
+from models import ArticleBatch
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Lemma first, then the flags that exclude a token from keyword candidates
+KEYWORD_TOKEN_ATTRS = [LEMMA, IS_STOP, IS_PUNCT, LIKE_NUM, IS_SPACE]
+# Text chunks buffered between the reader thread and spaCy
+CHUNK_QUEUE_SIZE = 64
+# Threads used to write the markdown files of one document
+MARKDOWN_WRITE_WORKERS = 16
+
 
 class DocumentProcessor:
     """Process legal documents: extract text, split into articles, extract keywords."""
     
-    def __init__(self, nlp_model: Optional[spacy.language.Language] = None):
+    # Drops characters not allowed in filenames and turns spaces into
+    # underscores in a single str.translate pass
+    _SANITIZE_TABLE = str.maketrans({c: None for c in '\\/:*?"<>|'} | {' ': '_'})
+    
+    def __init__(
+        self,
+        nlp_model: Optional[spacy.language.Language] = None,
+        pdf_page_workers: Optional[int] = None
+    ):
         """
         Initialize the processor.
         
         Args:
             nlp_model: Pre-loaded SpaCy model. If None, will load ru_core_news_sm
+            pdf_page_workers: Processes used to extract PDF pages. Above 1 they
+                form one pool kept for the processor's lifetime; None starts
+                a CPU-count pool per PDF
         """
+        self.pdf_page_workers = pdf_page_workers
+        # Spawned page processes are started on demand and then reused, so
+        # their start-up (re-importing the entry module) is paid only once
+        self._page_pool = (
+            create_page_pool(pdf_page_workers)
+            if pdf_page_workers and pdf_page_workers > 1 else None
+        )
+        
         if nlp_model is None:
             try:
                 self.nlp = spacy.load('ru_core_news_sm')
@@ -33,29 +66,55 @@ class DocumentProcessor:
         else:
             self.nlp = nlp_model
         
-        # Regex patterns for structure detection
-        self.article_start_pattern = re.compile(
-            r'^\s*Статья\s*\d+(?:\.\d+)*\.?\s*(.*)', 
-            re.IGNORECASE
-        )
-        self.section_start_pattern = re.compile(
-            r'^\s*Раздел\s+\d+\.?\s*(.*)', 
-            re.IGNORECASE
-        )
-        self.chapter_start_pattern = re.compile(
-            r'^\s*Глава\s+\d+\.?\s*(.*)', 
+        # Segmentation only needs sentence boundaries, so it runs the cheap
+        # rule-based sentencizer alone. Newlines are treated as boundaries
+        # because structural headings start on their own line.
+        if "sentencizer" not in self.nlp.pipe_names:
+            self.nlp.add_pipe(
+                "sentencizer",
+                config={"punct_chars": Sentencizer.default_punct_chars + ["\n"]}
+            )
+        self._segmenter_disable = [
+            name for name in self.nlp.pipe_names if name != "sentencizer"
+        ]
+        # Keyword extraction needs lemmas; the Russian lemmatizer relies on
+        # POS tags from the morphologizer, so only parser and NER are dropped.
+        self._keyword_disable = [
+            name for name in ("parser", "ner", "sentencizer")
+            if name in self.nlp.pipe_names
+        ]
+        
+        # Regex pattern for structure detection. A single alternation covers
+        # all heading kinds; the matched keyword selects the branch.
+        self.structure_start_pattern = re.compile(
+            r'^\s*(?P<kind>Статья(?=\s*\d)|(?:Раздел|Глава|§)(?=\s+\d))'
+            r'\s*\d+(?:\.\d+)*\.?\s*(.*)', 
             re.IGNORECASE
         )
-        self.paragraph_start_pattern = re.compile(
-            r'^\s*§\s+\d+\.?\s*(.*)', 
+        # Lowercased heading keywords used to skip the regex for ordinary
+        # sentences with a cheap prefix check.
+        self._struct_prefixes = ("статья", "раздел", "глава", "§")
+        
+        # Patterns used when building filenames, compiled once per processor
+        self._article_number_pattern = re.compile(
+            r'^\s*Статья\s*\d+(?:\.\d+)*\.?\s*', 
             re.IGNORECASE
         )
+        self._struct_id_patterns = {
+            prefix: self._compile_struct_id_pattern(prefix)
+            for prefix in ("Раздел", "Глава", "§", "Статья")
+        }
+    
+    @staticmethod
+    def _compile_struct_id_pattern(prefix: str) -> re.Pattern:
+        """Pattern capturing a structural identifier such as 'Глава 36'."""
+        return re.compile(r'(' + re.escape(prefix) + r'\s*\d+(?:\.\d+)*)', re.IGNORECASE)
     
     def extract_text_from_file(self, file_path: str) -> str:
         """Extract text from DOCX or PDF file."""
         return TextExtractor.extract_text(file_path)
     
-    def segment_into_articles(self, doc_text: str) -> List[Document]:
+    def segment_into_articles(self, doc_text: str) -> ArticleBatch:
         """
         Segment document text into articles with hierarchical metadata.
         
@@ -63,12 +122,16 @@ class DocumentProcessor:
             doc_text: Full document text
             
         Returns:
-            List of LangChain Document objects with article content and metadata
+            ArticleBatch with article titles, content and structural headings
         """
-        spacy_doc = self.nlp(doc_text)
-        logger.info(f"Document processed by SpaCy. Total sentences: {len(list(spacy_doc.sents))}")
-        
-        langchain_articles = []
+        with self.nlp.select_pipes(disable=self._segmenter_disable):
+            spacy_doc = self.nlp(doc_text)
+        logger.info("Document processed by SpaCy.")
+        return self._segment_sentences(sent.text for sent in spacy_doc.sents)
+    
+    def _segment_sentences(self, sentences: Iterable[str]) -> ArticleBatch:
+        """Run the heading state machine over sentence texts and build articles."""
+        articles = ArticleBatch()
         current_article_full_title = None
         current_article_content = []
         current_section_title = None
@@ -80,57 +143,54 @@ class DocumentProcessor:
             nonlocal current_section_title, current_chapter_title, current_paragraph_title
             
             if current_article_full_title and current_article_content:
-                full_content_str = "\n".join(current_article_content).strip()
-                metadata = {'article_title': current_article_full_title}
-                
-                if current_section_title:
-                    metadata['section_title'] = current_section_title
-                if current_chapter_title:
-                    metadata['chapter_title'] = current_chapter_title
-                if current_paragraph_title:
-                    metadata['paragraph_title'] = current_paragraph_title
-                
-                langchain_articles.append(
-                    Document(page_content=full_content_str, metadata=metadata)
+                articles.append(
+                    current_article_full_title,
+                    "\n".join(current_article_content).strip(),
+                    current_section_title,
+                    current_chapter_title,
+                    current_paragraph_title
                 )
             
             current_article_full_title = None
             current_article_content = []
         
-        for sent in spacy_doc.sents:
-            sent_text = sent.text.strip()
+        sent_count = 0
+        for sent_count, sent_text in enumerate(sentences, 1):
+            sent_text = sent_text.strip()
             if not sent_text:
                 continue
             
-            section_match = self.section_start_pattern.match(sent_text)
-            chapter_match = self.chapter_start_pattern.match(sent_text)
-            paragraph_match = self.paragraph_start_pattern.match(sent_text)
-            article_match = self.article_start_pattern.match(sent_text)
+            structure_match = None
+            if sent_text[:6].lower().startswith(self._struct_prefixes):
+                structure_match = self.structure_start_pattern.match(sent_text)
             
-            if section_match:
+            if structure_match is None:
+                if current_article_full_title:
+                    current_article_content.append(sent_text)
+                continue
+            
+            kind = structure_match.group('kind').lower()
+            if kind == 'раздел':
                 add_article_to_list()
-                current_section_title = section_match.group(0).strip()
+                current_section_title = structure_match.group(0).strip()
                 current_chapter_title = None
                 current_paragraph_title = None
-            elif chapter_match:
+            elif kind == 'глава':
                 add_article_to_list()
-                current_chapter_title = chapter_match.group(0).strip()
+                current_chapter_title = structure_match.group(0).strip()
                 current_paragraph_title = None
-            elif paragraph_match:
+            elif kind == '§':
                 add_article_to_list()
-                current_paragraph_title = paragraph_match.group(0).strip()
-            elif article_match:
+                current_paragraph_title = structure_match.group(0).strip()
+            else:
                 add_article_to_list()
-                current_article_full_title = article_match.group(0).strip()
+                current_article_full_title = structure_match.group(0).strip()
                 current_article_content.append(sent_text)
-            else:
-                if current_article_full_title:
-                    current_article_content.append(sent_text)
         
         add_article_to_list()
-        logger.info(f"Found {len(langchain_articles)} articles.")
+        logger.info(f"Total sentences: {sent_count}. Found {len(articles)} articles.")
         
-        return langchain_articles
+        return articles
     
     def extract_keywords_and_topic(
         self, 
@@ -149,52 +209,118 @@ class DocumentProcessor:
         Returns:
             Tuple of (keywords list, topic string)
         """
-        doc = self.nlp(text)
-        candidates = Counter()
-        
-        title_tokens = set(
-            token.lemma_.lower() 
-            for token in self.nlp(article_title) 
-            if not token.is_stop and not token.is_punct and not token.like_num
+        with self.nlp.select_pipes(disable=self._keyword_disable):
+            doc = self.nlp(text)
+        title_tokens = self._title_lemmas(doc, article_title)
+        return self._keywords_from_doc(doc, title_tokens, num_keywords)
+    
+    @staticmethod
+    def _lemma_set(tokens: Union[Doc, Span]) -> FrozenSet[str]:
+        """Lowercased lemmas of tokens that can be keywords."""
+        # Same attribute columns as the body, so flags are read in one pass
+        token_attrs = tokens.to_array(KEYWORD_TOKEN_ATTRS)
+        keep = ~token_attrs[:, 1:].any(axis=1)
+        strings = tokens.vocab.strings
+        return frozenset(
+            strings[int(lemma_id)].lower() for lemma_id in np.unique(token_attrs[keep, 0])
         )
+    
+    def _title_lemmas(self, doc: Doc, article_title: str) -> FrozenSet[str]:
+        """
+        Lemmas of the article title.
         
-        for token in doc:
-            if not token.is_stop and not token.is_punct and not token.like_num and token.text.strip():
-                lemma = token.lemma_.lower()
-                if lemma not in title_tokens:
-                    candidates[lemma] += 1
+        Segmented articles start with their title, so the title tokens are
+        taken from the already parsed article Doc; the title is only run
+        through spaCy on its own when the text does not start with it.
+        """
+        if doc.text.startswith(article_title):
+            title_span = doc.char_span(0, len(article_title), alignment_mode="expand")
+            return self._lemma_set(title_span) if title_span else frozenset()
+        with self.nlp.select_pipes(disable=self._keyword_disable):
+            return self._lemma_set(self.nlp(article_title))
+    
+    @staticmethod
+    def _keywords_from_doc(
+        doc: Doc,
+        title_tokens: FrozenSet[str],
+        num_keywords: int = 7
+    ) -> Tuple[List[str], str]:
+        """Compute keywords and topic from a pre-parsed article Doc."""
+        # Token attributes as one (n_tokens, 5) uint64 array, so filtering and
+        # counting lemmas happens in NumPy instead of a per-token Python loop.
+        token_attrs = doc.to_array(KEYWORD_TOKEN_ATTRS)
+        keep = ~token_attrs[:, 1:].any(axis=1)
+        lemma_ids = token_attrs[keep, 0]
+        
+        uniq, first_index, counts = np.unique(
+            lemma_ids, return_index=True, return_counts=True
+        )
+        title_ids = np.array(
+            [doc.vocab.strings[lemma] for lemma in title_tokens], dtype=np.uint64
+        )
+        not_title = np.isin(uniq, title_ids, invert=True)
+        uniq, first_index, counts = uniq[not_title], first_index[not_title], counts[not_title]
         
-        filtered_candidates = []
-        for item, count in candidates.most_common():
-            if len(item) > 2 and item not in title_tokens:
-                filtered_candidates.append(item)
+        # Only the most frequent lemmas are sorted: everything counted at
+        # least as often as the k-th largest count (ties included), with
+        # headroom for the length filter. The rest is sorted only if the
+        # filter leaves too few keywords.
+        candidate_count = num_keywords * 3
+        if len(counts) > candidate_count:
+            kth = len(counts) - candidate_count
+            head = counts >= np.partition(counts, kth)[kth]
+            tiers = (head, ~head)
+        else:
+            tiers = (slice(None),)
         
-        keywords = filtered_candidates[:num_keywords]
+        keywords = []
+        for tier in tiers:
+            # Most frequent first; ties keep first-occurrence order like Counter.most_common
+            order = np.lexsort((first_index[tier], -counts[tier]))
+            for lemma_id in uniq[tier][order]:
+                item = doc.vocab.strings[int(lemma_id)].lower()
+                if len(item) > 2 and item not in title_tokens and item not in keywords:
+                    keywords.append(item)
+                    if len(keywords) == num_keywords:
+                        break
+            if len(keywords) == num_keywords:
+                break
         
         topic = keywords[0] if keywords else "Общее положение"
         
         return keywords, topic
     
-    def enrich_articles_with_metadata(self, articles: List[Document]) -> List[Document]:
+    def enrich_articles_with_metadata(self, articles: ArticleBatch) -> ArticleBatch:
         """
-        Add keywords and topics to article metadata.
+        Fill the keywords and topics columns of an article batch.
         
         Args:
-            articles: List of Document objects
+            articles: ArticleBatch from segment_into_articles
             
         Returns:
-            Same list with enriched metadata
+            Same batch with keywords and topics set
         """
         logger.info("Extracting keywords and topics...")
         
-        for article_doc in articles:
-            text_content = article_doc.page_content
-            article_title = article_doc.metadata.get('article_title', '')
-            
-            keywords, topic = self.extract_keywords_and_topic(text_content, article_title)
-            
-            article_doc.metadata['keywords'] = keywords
-            article_doc.metadata['topic'] = topic
+        # The article index travels with each text so each result lands in
+        # its own row of the keyword and topic columns
+        docs_with_index = self.nlp.pipe(
+            ((content, index) for index, content in enumerate(articles.contents)),
+            as_tuples=True,
+            batch_size=32,
+            disable=self._keyword_disable
+        )
+        
+        keywords_column: List[List[str]] = [[] for _ in range(len(articles))]
+        topics_column: List[str] = [""] * len(articles)
+        for doc, index in docs_with_index:
+            title_tokens = self._title_lemmas(doc, articles.titles[index])
+            keywords_column[index], topics_column[index] = self._keywords_from_doc(
+                doc, title_tokens
+            )
+        
+        articles.keywords = keywords_column
+        articles.topics = topics_column
         
         logger.info(f"Successfully extracted keywords and topics for {len(articles)} articles.")
         return articles
@@ -202,20 +328,16 @@ class DocumentProcessor:
     @staticmethod
     def sanitize_string_for_filename(text: str, max_length: int = 200) -> str:
         """Sanitize string for safe filename use."""
-        sanitized = re.sub(r'[\\/:*?"<>|]', '', text)
-        sanitized = sanitized.replace(' ', '_').strip()
-        return sanitized[:max_length]
+        return text.translate(DocumentProcessor._SANITIZE_TABLE).strip()[:max_length]
     
-    @staticmethod
-    def get_structure_filename_id(title: str, prefix: str, max_length: int = 50) -> str:
+    def get_structure_filename_id(self, title: str, prefix: str, max_length: int = 50) -> str:
         """Extract structural identifier from title for filename."""
-        match = re.search(
-            r'(' + re.escape(prefix) + r'\s*\d+(?:\.\d+)*)', 
-            title, 
-            re.IGNORECASE
-        )
+        pattern = self._struct_id_patterns.get(prefix)
+        if pattern is None:
+            pattern = self._struct_id_patterns[prefix] = self._compile_struct_id_pattern(prefix)
+        match = pattern.search(title)
         if match:
-            return DocumentProcessor.sanitize_string_for_filename(
+            return self.sanitize_string_for_filename(
                 match.group(1), 
                 max_length=max_length
             )
@@ -223,7 +345,7 @@ class DocumentProcessor:
     
     def save_articles_to_markdown(
         self, 
-        articles: List[Document], 
+        articles: ArticleBatch, 
         output_dir: str,
         doc_base_name: str = "document"
     ) -> List[str]:
@@ -231,7 +353,7 @@ class DocumentProcessor:
         Save articles as individual markdown files.
         
         Args:
-            articles: List of Document objects with content and metadata
+            articles: ArticleBatch with content, headings, keywords and topics
             output_dir: Directory to save markdown files
             doc_base_name: Base name for the document (used in filenames)
             
@@ -246,19 +368,25 @@ class DocumentProcessor:
             max_length=40
         )
         
-        created_files = []
+        # (path, fallback path, content, title) per article; formatting is
+        # CPU-bound, the writes themselves are done by a thread pool below
+        pending_writes = []
+        # Files are written concurrently, so two articles must never share a
+        # path; later duplicates (same truncated name, repeated article
+        # numbers) are saved under their fallback name instead
+        used_paths = set()
         
-        for i, article_doc in enumerate(articles):
-            full_article_title = article_doc.metadata.get(
-                "article_title", 
-                f"Untitled_Article_{i+1}"
-            )
-            content = article_doc.page_content
-            keywords = article_doc.metadata.get("keywords", [])
-            topic = article_doc.metadata.get("topic", "")
-            section_title = article_doc.metadata.get("section_title", "")
-            chapter_title = article_doc.metadata.get("chapter_title", "")
-            paragraph_title = article_doc.metadata.get("paragraph_title", "")
+        # Articles that were never enriched have empty keyword/topic columns
+        keywords_column = articles.keywords or [[]] * len(articles)
+        topics_column = articles.topics or [""] * len(articles)
+        rows = zip(
+            articles.titles, articles.contents, articles.sections,
+            articles.chapters, articles.paragraphs, keywords_column, topics_column
+        )
+        
+        for i, (full_article_title, content, section_title, chapter_title,
+                paragraph_title, keywords, topic) in enumerate(rows):
+            full_article_title = full_article_title or f"Untitled_Article_{i+1}"
             
             markdown_content = f"# {full_article_title}\n\n"
             if section_title:
@@ -292,11 +420,9 @@ class DocumentProcessor:
             if article_id_part:
                 filename_parts.append(article_id_part)
             
-            descriptive_title_raw = re.sub(
-                r'^\s*Статья\s*\d+(?:\.\d+)*\.?\s*', 
+            descriptive_title_raw = self._article_number_pattern.sub(
                 '', 
-                full_article_title, 
-                flags=re.IGNORECASE
+                full_article_title
             ).strip()
             
             if descriptive_title_raw:
@@ -323,26 +449,159 @@ class DocumentProcessor:
                 filename = base[:max_total_filename_length - len(ext)] + ext
             
             file_path = os.path.join(output_dir, filename)
-            
+            fallback_filename = f"{sanitized_doc_name_prefix}_Article_{i+1}.md"
+            fallback_file_path = os.path.join(output_dir, fallback_filename)
+            if file_path in used_paths:
+                logger.warning(
+                    f"Duplicate filename '{filename}', saving as '{fallback_filename}'"
+                )
+                file_path = fallback_file_path
+            used_paths.add(file_path)
+            pending_writes.append(
+                (file_path, fallback_file_path, markdown_content, full_article_title)
+            )
+        
+        # File creation is dominated by open/write/close syscalls, which
+        # release the GIL, so the files are written concurrently.
+        with ThreadPoolExecutor(max_workers=MARKDOWN_WRITE_WORKERS) as executor:
+            written = list(executor.map(
+                lambda args: self._write_markdown_file(*args),
+                pending_writes
+            ))
+        created_files = [file_path for file_path in written if file_path]
+        
+        logger.info(f"Successfully saved {len(created_files)} articles as markdown files.")
+        return created_files
+    
+    @staticmethod
+    def _write_markdown_file(
+        file_path: str,
+        fallback_file_path: str,
+        markdown_content: str,
+        article_title: str
+    ) -> Optional[str]:
+        """Write one article, retrying under the fallback name. Returns the path written."""
+        try:
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(markdown_content)
+            return file_path
+        except OSError as e:
+            logger.warning(f"Error saving file '{file_path}': {e}")
+            logger.info(f"Attempting fallback filename: '{fallback_file_path}'")
             try:
-                with open(file_path, "w", encoding="utf-8") as f:
+                with open(fallback_file_path, "w", encoding="utf-8") as f:
                     f.write(markdown_content)
-                created_files.append(file_path)
-            except OSError as e:
-                logger.warning(f"Error saving file '{file_path}': {e}")
-                fallback_filename = f"{sanitized_doc_name_prefix}_Article_{i+1}.md"
-                fallback_file_path = os.path.join(output_dir, fallback_filename)
-                logger.info(f"Attempting fallback filename: '{fallback_file_path}'")
+                return fallback_file_path
+            except OSError as fallback_e:
+                logger.error(f"Fallback failed for '{article_title}': {fallback_e}")
+                return None
+    
+    def process_documents(
+        self,
+        file_paths: List[str],
+        output_dirs: List[str],
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[Dict]:
+        """
+        Batched processing pipeline for several documents.
+        
+        The stages overlap: a reader thread extracts text chunks into a
+        bounded queue, the calling thread streams them through a single
+        nlp.pipe call for segmentation and extracts keywords per document,
+        and a writer thread saves each finished document while the next one
+        is being parsed.
+        
+        Args:
+            file_paths: Paths to input documents (DOCX or PDF)
+            output_dirs: Output directory for each document; entries may repeat
+            progress_callback: Called as (documents_done, documents_total)
+                after each document has been analysed
+            
+        Returns:
+            List of dicts with processing results, one per input document
+        """
+        doc_base_names = [
+            os.path.splitext(os.path.basename(file_path))[0]
+            for file_path in file_paths
+        ]
+        
+        chunk_queue = queue.Queue(maxsize=CHUNK_QUEUE_SIZE)
+        stop_reading = threading.Event()
+        
+        def put_chunk(item) -> bool:
+            # Give up once the consumer has stopped, instead of blocking forever
+            while not stop_reading.is_set():
                 try:
-                    with open(fallback_file_path, "w", encoding="utf-8") as f:
-                        f.write(markdown_content)
-                    created_files.append(fallback_file_path)
-                except OSError as fallback_e:
-                    logger.error(f"Fallback failed for '{full_article_title}': {fallback_e}")
+                    chunk_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
                     continue
+            return False
         
-        logger.info(f"Successfully saved {len(created_files)} articles as markdown files.")
-        return created_files
+        def read_chunks():
+            try:
+                for index, file_path in enumerate(file_paths):
+                    logger.info(f"Processing document: {file_path}")
+                    for chunk in TextExtractor.iter_text(
+                        file_path, self.pdf_page_workers, self._page_pool
+                    ):
+                        if chunk.strip() and not put_chunk((chunk, index)):
+                            return
+            except Exception as e:
+                put_chunk(e)
+            finally:
+                put_chunk(None)
+        
+        def queued_chunks():
+            while True:
+                item = chunk_queue.get()
+                if item is None:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        
+        reader = threading.Thread(target=read_chunks, name="chunk-reader", daemon=True)
+        reader.start()
+        
+        article_counts = [0] * len(file_paths)
+        save_futures = {}
+        try:
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="article-writer") as writer:
+                spacy_docs = self.nlp.pipe(
+                    queued_chunks(),
+                    as_tuples=True,
+                    batch_size=32,
+                    disable=self._segmenter_disable
+                )
+                for index, doc_chunks in groupby(spacy_docs, key=lambda pair: pair[1]):
+                    articles = self._segment_sentences(
+                        sent.text for spacy_doc, _ in doc_chunks for sent in spacy_doc.sents
+                    )
+                    self.enrich_articles_with_metadata(articles)
+                    article_counts[index] = len(articles)
+                    save_futures[index] = writer.submit(
+                        self.save_articles_to_markdown,
+                        articles,
+                        output_dirs[index],
+                        doc_base_names[index]
+                    )
+                    if progress_callback:
+                        progress_callback(index + 1, len(file_paths))
+        finally:
+            stop_reading.set()
+        
+        results = []
+        for index, (doc_base_name, output_dir) in enumerate(zip(doc_base_names, output_dirs)):
+            created_files = save_futures[index].result() if index in save_futures else []
+            results.append({
+                'document': doc_base_name,
+                'articles_count': article_counts[index],
+                'files_created': len(created_files),
+                'output_dir': output_dir
+            })
+        
+        return results
     
     def process_document(
         self, 
@@ -359,24 +618,4 @@ class DocumentProcessor:
         Returns:
             Dict with processing results
         """
-        doc_base_name = os.path.splitext(os.path.basename(file_path))[0]
-        
-        logger.info(f"Processing document: {file_path}")
-        doc_text = self.extract_text_from_file(file_path)
-        logger.info(f"Extracted {len(doc_text)} characters from document.")
-        
-        articles = self.segment_into_articles(doc_text)
-        articles = self.enrich_articles_with_metadata(articles)
-        
-        created_files = self.save_articles_to_markdown(
-            articles, 
-            output_dir, 
-            doc_base_name
-        )
-        
-        return {
-            'document': doc_base_name,
-            'articles_count': len(articles),
-            'files_created': len(created_files),
-            'output_dir': output_dir
-        }
+        return self.process_documents([file_path], [output_dir])[0]
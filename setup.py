@@ -30,7 +30,8 @@ setup(
         "python-docx==1.1.0",
         "pdfplumber==0.10.3",
         "spacy==3.7.2",
-        "langchain==0.1.0",
+        "numpy==1.26.2",
+        "isal==1.5.3",
     ],
     entry_points={
         "console_scripts": [
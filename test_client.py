@@ -2,142 +2,438 @@
 """
 Simple test client for Legal Document Splitter API
 """
-import requests
-import time
+import aiohttp
+import argparse
+import asyncio
+import orjson
+import os
 import sys
+import tarfile
+import tempfile
+from collections import deque
 from pathlib import Path
-from typing import List
+from typing import AsyncIterator, Deque, List
 
 
 API_URL = "http://localhost:8000"
+# Upper bound on simultaneous connections to the API
+MAX_CONNECTIONS = 16
+# Jobs followed at once; each holds a status WebSocket and then a download,
+# so this stays below MAX_CONNECTIONS to leave connections for other requests
+JOB_CONCURRENCY = 8
+# Idle pooled connections are kept below the server's 30 s keep-alive, so
+# the client never reuses a socket the server is about to close
+KEEPALIVE_TIMEOUT = 25
+# Status polling backs off from MIN to MAX seconds while nothing changes
+MIN_POLL_INTERVAL = 0.25
+MAX_POLL_INTERVAL = 10.0
+POLL_BACKOFF = 1.5
+UPLOAD_CHUNK_SIZE = 1 << 20
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+# Simultaneous upload requests, the usual per-host browser connection budget
+UPLOAD_CONCURRENCY = 6
+# Packed archives are built in memory up to this size, then on disk
+PACK_SPOOL_SIZE = 64 << 20
+# Console output is collected and written in one batch per interval
+OUTPUT_FLUSH_INTERVAL = 0.1
 
+# Lines waiting for the next flush
+output_lines: Deque[str] = deque()
 
-def upload_files(file_paths: List[Path], merge_mode: bool = False) -> str:
-    """Upload files and get job ID."""
-    files = []
+
+def emit(line: str):
+    """Queue a line of console output."""
+    output_lines.append(line)
+
+
+def flush_output():
+    """Write all queued output with a single write call."""
+    if not output_lines:
+        return
+    lines = []
+    while output_lines:
+        lines.append(output_lines.popleft())
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
+
+
+async def output_flusher():
+    """Flush queued output periodically until cancelled."""
+    while True:
+        await asyncio.sleep(OUTPUT_FLUSH_INTERVAL)
+        flush_output()
+
+
+async def upload_files(
+    session: aiohttp.ClientSession,
+    file_paths: List[Path],
+    merge_mode: bool = False,
+    concurrency: int = UPLOAD_CONCURRENCY
+) -> List[str]:
+    """
+    Upload files and get job IDs.
+    
+    In merge mode all files are sent in one request and processed as one job.
+    Otherwise every file is posted as a job of its own, with at most
+    `concurrency` uploads in flight.
+    """
+    emit(f"📤 Uploading {len(file_paths)} file(s) (merge_mode={merge_mode})...")
+    
+    if merge_mode:
+        job_ids = [await post_upload(session, file_paths, merge_mode)]
+    else:
+        semaphore = asyncio.Semaphore(min(len(file_paths), concurrency))
+        
+        async def upload_one(file_path: Path) -> str:
+            async with semaphore:
+                return await post_upload(session, [file_path], merge_mode)
+        
+        job_ids = await asyncio.gather(*(upload_one(file_path) for file_path in file_paths))
+    
+    for job_id in job_ids:
+        emit(f"✅ Job created: {job_id}")
+    return list(job_ids)
+
+
+async def post_upload(
+    session: aiohttp.ClientSession,
+    file_paths: List[Path],
+    merge_mode: bool
+) -> str:
+    """Send one multipart upload request and return its job ID."""
+    form = aiohttp.FormData()
+    form.add_field('merge_mode', str(merge_mode).lower())
     for file_path in file_paths:
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-        files.append(
-            ('files', (file_path.name, open(file_path, 'rb'), 'application/octet-stream'))
+        form.add_field(
+            'files',
+            read_file_chunks(file_path),
+            filename=file_path.name,
+            content_type='application/octet-stream'
         )
     
-    print(f"📤 Uploading {len(files)} file(s) (merge_mode={merge_mode})...")
+    try:
+        async with session.post(f"{API_URL}/upload", data=form) as response:
+            if response.status != 200:
+                raise Exception(f"Upload failed: {await response.text()}")
+            data = await response.json(loads=orjson.loads)
+    except aiohttp.ClientOSError as e:
+        # aiohttp wraps errors raised while writing the body; surface a
+        # missing file as such rather than as a connection error
+        if isinstance(e.__cause__, FileNotFoundError):
+            raise e.__cause__ from None
+        raise
     
-    response = requests.post(
-        f"{API_URL}/upload",
-        files=files,
-        data={'merge_mode': str(merge_mode).lower()}
-    )
+    return data['job_id']
+
+
+async def upload_pack(
+    session: aiohttp.ClientSession,
+    file_paths: List[Path],
+    merge_mode: bool = False
+) -> str:
+    """Upload all files as a single tar archive and get the job ID."""
+    emit(f"📦 Packing and uploading {len(file_paths)} file(s) (merge_mode={merge_mode})...")
     
-    if response.status_code != 200:
-        raise Exception(f"Upload failed: {response.text}")
+    with await asyncio.to_thread(pack_files, file_paths) as archive:
+        form = aiohttp.FormData()
+        form.add_field('merge_mode', str(merge_mode).lower())
+        form.add_field(
+            'archive',
+            archive,
+            filename='documents.tar',
+            content_type='application/x-tar'
+        )
+        
+        async with session.post(f"{API_URL}/upload_pack", data=form) as response:
+            if response.status != 200:
+                raise Exception(f"Upload failed: {await response.text()}")
+            data = await response.json(loads=orjson.loads)
     
-    data = response.json()
     job_id = data['job_id']
-    print(f"✅ Job created: {job_id}")
+    emit(f"✅ Job created: {job_id}")
     return job_id
 
 
-def wait_for_completion(job_id: str, poll_interval: int = 2) -> dict:
-    """Poll job status until completion."""
-    print(f"⏳ Waiting for job completion...")
+def pack_files(file_paths: List[Path]) -> tempfile.SpooledTemporaryFile:
+    """
+    Pack files into an uncompressed tar archive.
+    
+    DOCX and PDF bodies are already compressed, so the archive is not.
+    
+    Raises:
+        ValueError: If two files share a name; members are stored by name only
+    """
+    names = [file_path.name for file_path in file_paths]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate file names cannot be packed: {', '.join(duplicates)}")
+    
+    archive = tempfile.SpooledTemporaryFile(max_size=PACK_SPOOL_SIZE)
+    with tarfile.open(fileobj=archive, mode='w') as tar:
+        for file_path in file_paths:
+            tar.add(file_path, arcname=file_path.name)
+    archive.seek(0)
+    return archive
+
+
+async def read_file_chunks(file_path: Path) -> AsyncIterator[bytes]:
+    """
+    Stream a file into a request body.
+    
+    The file is opened only when the request reaches its part and closed as
+    soon as it has been sent, so a multi-file upload holds one open file.
+    """
+    try:
+        f = open(file_path, 'rb')
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"File not found: {file_path}") from e
+    with f:
+        while chunk := await asyncio.to_thread(f.read, UPLOAD_CHUNK_SIZE):
+            yield chunk
+
+
+async def wait_for_completion(
+    session: aiohttp.ClientSession,
+    job_id: str,
+    max_poll_interval: float = MAX_POLL_INTERVAL
+) -> dict:
+    """Wait for job completion using pushed status updates."""
+    emit(f"⏳ Waiting for job {job_id} completion...")
+    
+    try:
+        # permessage-deflate keeps the compression context across frames,
+        # so the repetitive status JSON shrinks to a few bytes per update
+        ws = await session.ws_connect(f"{API_URL}/ws/status/{job_id}", compress=15)
+    except aiohttp.WSServerHandshakeError:
+        # Server without the status WebSocket (or unknown job): poll instead
+        return await poll_for_completion(session, job_id, max_poll_interval)
+    
+    async with ws:
+        async for msg in ws:
+            if msg.type != aiohttp.WSMsgType.TEXT:
+                break
+            status_data = msg.json(loads=orjson.loads)
+            if report_status(job_id, status_data):
+                return status_data
+    
+    raise Exception("Status stream closed before the job finished")
+
+
+async def poll_for_completion(
+    session: aiohttp.ClientSession,
+    job_id: str,
+    max_poll_interval: float = MAX_POLL_INTERVAL
+) -> dict:
+    """
+    Poll job status until completion.
+    
+    The interval grows while the status stays the same and drops back to
+    MIN_POLL_INTERVAL when it changes. Unchanged polls are answered with an
+    empty 304 thanks to the status ETag.
+    """
+    interval = MIN_POLL_INTERVAL
+    etag = None
+    last_progress = None
     
     while True:
-        response = requests.get(f"{API_URL}/status/{job_id}")
-        if response.status_code != 200:
-            raise Exception(f"Status check failed: {response.text}")
-        
-        status_data = response.json()
-        status = status_data['status']
-        progress = status_data['progress']
-        message = status_data['message']
-        
-        print(f"   [{progress:3d}%] {status.upper()}: {message}")
+        headers = {'If-None-Match': etag} if etag else {}
+        async with session.get(f"{API_URL}/status/{job_id}", headers=headers) as response:
+            if response.status == 304:
+                status_data = None
+            elif response.status == 200:
+                etag = response.headers.get('ETag')
+                status_data = await response.json(loads=orjson.loads)
+            else:
+                raise Exception(f"Status check failed: {await response.text()}")
         
-        if status == 'completed':
-            print(f"✅ Processing completed!")
-            if status_data.get('total_articles'):
-                print(f"   Total articles extracted: {status_data['total_articles']}")
-            return status_data
-        elif status == 'failed':
-            error = status_data.get('error', 'Unknown error')
-            raise Exception(f"Processing failed: {error}")
+        if status_data is None:
+            progress = last_progress
+        else:
+            if report_status(job_id, status_data):
+                return status_data
+            progress = (status_data['status'], status_data['progress'])
         
-        time.sleep(poll_interval)
+        if progress == last_progress:
+            interval = min(max_poll_interval, interval * POLL_BACKOFF)
+        else:
+            last_progress = progress
+            interval = MIN_POLL_INTERVAL
+        await asyncio.sleep(interval)
+
+
+def report_status(job_id: str, status_data: dict) -> bool:
+    """Print a status update; True once the job has completed."""
+    status = status_data['status']
+    progress = status_data['progress']
+    message = status_data['message']
+    
+    emit(f"   {job_id[:8]} [{progress:3d}%] {status.upper()}: {message}")
+    
+    if status == 'completed':
+        emit(f"✅ Processing of job {job_id} completed!")
+        if status_data.get('total_articles'):
+            emit(f"   Total articles extracted: {status_data['total_articles']}")
+        return True
+    elif status == 'failed':
+        error = status_data.get('error', 'Unknown error')
+        raise Exception(f"Processing failed: {error}")
+    return False
 
 
-def download_result(job_id: str, output_path: Path = None) -> Path:
+async def download_result(
+    session: aiohttp.ClientSession,
+    job_id: str,
+    output_path: Path = None
+) -> Path:
     """Download the result ZIP file."""
     if output_path is None:
         output_path = Path(f"results_{job_id}.zip")
     
-    print(f"⬇️  Downloading results...")
+    emit(f"⬇️  Downloading results of job {job_id}...")
     
-    response = requests.get(f"{API_URL}/download/{job_id}", stream=True)
-    if response.status_code != 200:
-        raise Exception(f"Download failed: {response.text}")
-    
-    with open(output_path, 'wb') as f:
-        for chunk in response.iter_content(chunk_size=8192):
-            f.write(chunk)
+    async with session.get(f"{API_URL}/download/{job_id}") as response:
+        if response.status != 200:
+            raise Exception(f"Download failed: {await response.text()}")
+        
+        # Writes run in a thread, so the connection keeps filling the
+        # response buffer while a chunk is being written to disk
+        with open(output_path, 'wb', buffering=DOWNLOAD_CHUNK_SIZE) as f:
+            preallocate(f, response.content_length)
+            async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                await asyncio.to_thread(f.write, chunk)
     
     file_size = output_path.stat().st_size / 1024 / 1024
-    print(f"✅ Downloaded: {output_path} ({file_size:.2f} MB)")
+    emit(f"✅ Downloaded: {output_path} ({file_size:.2f} MB)")
     return output_path
 
 
-def check_health() -> dict:
+def preallocate(f, size: int = None):
+    """Reserve disk blocks for a file of known size where the OS supports it."""
+    if not size or not hasattr(os, 'posix_fallocate'):
+        return
+    try:
+        os.posix_fallocate(f.fileno(), 0, size)
+    except OSError:
+        # Not supported by this filesystem; the file just grows as written
+        pass
+
+
+async def check_health(session: aiohttp.ClientSession) -> dict:
     """Check API health."""
-    response = requests.get(f"{API_URL}/health")
-    if response.status_code != 200:
-        raise Exception(f"Health check failed: {response.text}")
-    return response.json()
+    async with session.get(f"{API_URL}/health") as response:
+        if response.status != 200:
+            raise Exception(f"Health check failed: {await response.text()}")
+        return await response.json(loads=orjson.loads)
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Session shared by every request of a run, with pooled keep-alive connections."""
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONNECTIONS,
+        keepalive_timeout=KEEPALIVE_TIMEOUT
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={'Accept': 'application/json'}
+    )
 
 
-def main():
+async def process_job(
+    session: aiohttp.ClientSession,
+    job_id: str,
+    semaphore: asyncio.Semaphore,
+    max_poll_interval: float = MAX_POLL_INTERVAL
+) -> Path:
+    """Wait for a job and download its results."""
+    async with semaphore:
+        await wait_for_completion(session, job_id, max_poll_interval)
+        return await download_result(session, job_id)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Test client for Legal Document Splitter API",
+        epilog=(
+            "examples:\n"
+            "  python test_client.py document.docx\n"
+            "  python test_client.py doc1.pdf doc2.docx --merge\n"
+            "  python test_client.py docs/*.pdf --pack"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('files', nargs='+', type=Path, help="DOCX or PDF files to process")
+    parser.add_argument(
+        '--merge', action='store_true',
+        help="merge all files into a single output"
+    )
+    parser.add_argument(
+        '--pack', action='store_true',
+        help="upload all files as one tar archive (a single job)"
+    )
+    parser.add_argument(
+        '--concurrency', type=int, default=UPLOAD_CONCURRENCY, metavar='N',
+        help=f"simultaneous per-file uploads (default: {UPLOAD_CONCURRENCY})"
+    )
+    parser.add_argument(
+        '--poll-interval', type=float, default=MAX_POLL_INTERVAL, metavar='SECONDS',
+        help=(
+            "longest wait between status polls when the status WebSocket is "
+            f"unavailable (default: {MAX_POLL_INTERVAL:g})"
+        )
+    )
+    args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    return args
+
+
+async def main():
     """Main test function."""
-    if len(sys.argv) < 2:
-        print("Usage: python test_client.py <file1.docx> [file2.pdf] [--merge]")
-        print("\nExample:")
-        print("  python test_client.py document.docx")
-        print("  python test_client.py doc1.pdf doc2.docx --merge")
-        sys.exit(1)
-    
-    # Parse arguments
-    files = []
-    merge_mode = False
-    
-    for arg in sys.argv[1:]:
-        if arg == '--merge':
-            merge_mode = True
-        else:
-            files.append(Path(arg))
-    
-    if not files:
-        print("❌ No files specified")
-        sys.exit(1)
+    args = parse_args()
     
+    flusher = asyncio.create_task(output_flusher())
     try:
-        # Check health
-        print("🏥 Checking API health...")
-        health = check_health()
-        print(f"   Status: {health['status']}")
-        print(f"   SpaCy model loaded: {health['spacy_model_loaded']}")
-        print(f"   Active jobs: {health['active_jobs']}\n")
-        
-        # Process workflow
-        job_id = upload_files(files, merge_mode)
-        wait_for_completion(job_id)
-        result_file = download_result(job_id)
-        
-        print(f"\n🎉 Success! Results saved to: {result_file}")
-        print(f"   Extract with: unzip {result_file}")
-        
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        sys.exit(1)
+        await run(args)
+    finally:
+        flusher.cancel()
+        flush_output()
+
+
+async def run(args: argparse.Namespace):
+    """Upload, process and download the files given on the command line."""
+    async with create_session() as session:
+        try:
+            # Check health
+            emit("🏥 Checking API health...")
+            health = await check_health(session)
+            emit(f"   Status: {health['status']}")
+            emit(f"   SpaCy model loaded: {health['spacy_model_loaded']}")
+            emit(f"   Active jobs: {health['active_jobs']}\n")
+            
+            # Process workflow
+            if args.pack:
+                job_ids = [await upload_pack(session, args.files, args.merge)]
+            else:
+                job_ids = await upload_files(
+                    session, args.files, args.merge, args.concurrency
+                )
+            semaphore = asyncio.Semaphore(JOB_CONCURRENCY)
+            result_files = await asyncio.gather(
+                *(
+                    process_job(session, job_id, semaphore, args.poll_interval)
+                    for job_id in job_ids
+                )
+            )
+            
+            emit(f"\n🎉 Success! Results saved to: {', '.join(map(str, result_files))}")
+            for result_file in result_files:
+                emit(f"   Extract with: unzip {result_file}")
+            
+        except Exception as e:
+            emit(f"\n❌ Error: {e}")
+            sys.exit(1)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
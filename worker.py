@@ -0,0 +1,180 @@
+import os
+import zipfile
+import logging
+from pathlib import Path
+from typing import List, Dict, Optional
+from contextlib import contextmanager
+
+import spacy
+
+try:
+    # Optional ISA-L binding: SIMD DEFLATE and CRC32, API-compatible with zlib
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+from models import JobStatus
+from processor import DocumentProcessor
+
+logger = logging.getLogger(__name__)
+
+SPACY_MODEL = 'ru_core_news_sm'
+# Components never used by the processor: sentences come from the sentencizer
+# and entities are not needed. Excluded pipes are not even loaded.
+SPACY_EXCLUDE = ['parser', 'ner']
+# Archives are downloaded once and deleted, so favour speed over size.
+# 0 stores files uncompressed, 1-9 are DEFLATE levels.
+ZIP_LEVEL = int(os.environ.get("LDS_ZIP_LEVEL", "1"))
+
+# Per-process state, set up once by init_worker
+_processor: Optional[DocumentProcessor] = None
+
+
+def init_worker(pdf_page_workers: int = 1):
+    """
+    Process pool initializer: load the SpaCy model once per worker.
+    
+    Args:
+        pdf_page_workers: Processes each worker may use to extract PDF pages
+    """
+    global _processor
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    logger.info(f"Worker {os.getpid()}: Loading SpaCy model...")
+    _processor = DocumentProcessor(
+        spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDE),
+        pdf_page_workers=pdf_page_workers
+    )
+    logger.info(f"Worker {os.getpid()}: SpaCy model loaded.")
+
+
+def worker_ready() -> bool:
+    """Pool warm-up task: True once init_worker has loaded the model."""
+    return _processor is not None
+
+
+@contextmanager
+def zip_codec():
+    """
+    Route zipfile's DEFLATE compressor and CRC32 through ISA-L when available.
+    
+    ISA-L only implements levels 0-3, so higher ZIP_LEVEL values keep zlib.
+    """
+    if isal_zlib is None or ZIP_LEVEL > 3:
+        yield
+        return
+    saved = zipfile.zlib, zipfile.crc32
+    zipfile.zlib, zipfile.crc32 = isal_zlib, isal_zlib.crc32
+    try:
+        yield
+    finally:
+        zipfile.zlib, zipfile.crc32 = saved
+
+
+def create_zip_archive(source_dir: Path, output_zip: Path) -> Path:
+    """Create a zip archive from directory contents."""
+    if ZIP_LEVEL == 0:
+        compression, compresslevel = zipfile.ZIP_STORED, None
+    else:
+        compression, compresslevel = zipfile.ZIP_DEFLATED, ZIP_LEVEL
+    with zip_codec(), zipfile.ZipFile(
+        output_zip, 'w', compression, compresslevel=compresslevel
+    ) as zipf:
+        for root, dirs, files in os.walk(source_dir):
+            for file in files:
+                file_path = Path(root) / file
+                arcname = file_path.relative_to(source_dir)
+                zipf.write(file_path, arcname)
+    return output_zip
+
+
+def process_documents_job(
+    job_id: str,
+    job_dir: Path,
+    file_paths: List[Path],
+    merge_mode: bool,
+    progress: Dict
+) -> Dict:
+    """
+    Process an upload job. Runs in a worker process.
+    
+    Args:
+        job_id: Job identifier
+        job_dir: Job directory; results are written to its output/ subdirectory
+        file_paths: Uploaded documents
+        merge_mode: If True, merge all files into single output
+        progress: Shared dict; intermediate status is published under job_id
+        
+    Returns:
+        Final job fields (status, message, progress and results or error)
+    """
+    def report(status: JobStatus, progress_value: int, message: str):
+        progress[job_id] = {
+            'status': status,
+            'progress': progress_value,
+            'message': message
+        }
+    
+    try:
+        report(JobStatus.PROCESSING, 0, "Processing documents...")
+        
+        output_base_dir = job_dir / "output"
+        output_base_dir.mkdir(exist_ok=True)
+        
+        if merge_mode:
+            # Process all files into a single output directory
+            merged_output_dir = output_base_dir / "merged_articles"
+            merged_output_dir.mkdir(exist_ok=True)
+            output_dirs = [merged_output_dir] * len(file_paths)
+        else:
+            # Process each file into separate directories
+            output_dirs = []
+            for file_path in file_paths:
+                file_output_dir = output_base_dir / file_path.stem
+                file_output_dir.mkdir(exist_ok=True)
+                output_dirs.append(file_output_dir)
+        
+        report(JobStatus.PROCESSING, 0, f"Processing {len(file_paths)} file(s)...")
+        
+        def on_document_done(done: int, total: int):
+            report(
+                JobStatus.PROCESSING,
+                int((done / total) * 90),
+                f"Processed file {done}/{total}: {file_paths[done - 1].name}"
+            )
+        
+        results = _processor.process_documents(
+            [str(file_path) for file_path in file_paths],
+            [str(output_dir) for output_dir in output_dirs],
+            progress_callback=on_document_done
+        )
+        for file_path, result in zip(file_paths, results):
+            logger.info(f"Processed {file_path.name}: {result['articles_count']} articles")
+        total_articles = sum(result['articles_count'] for result in results)
+        
+        # Create zip archive
+        report(JobStatus.PROCESSING, 95, "Creating archive...")
+        
+        zip_path = job_dir / f"{job_id}.zip"
+        create_zip_archive(output_base_dir, zip_path)
+        
+        logger.info(f"Job {job_id} completed. Total articles: {total_articles}")
+        return {
+            'status': JobStatus.COMPLETED,
+            'message': "Processing completed successfully",
+            'progress': 100,
+            'total_articles': total_articles,
+            'zip_path': zip_path
+        }
+        
+    except Exception as e:
+        logger.error(f"Job {job_id} failed: {str(e)}", exc_info=True)
+        return {
+            'status': JobStatus.FAILED,
+            'message': "Processing failed",
+            'error': str(e),
+            'progress': 0
+        }